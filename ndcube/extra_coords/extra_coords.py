@@ -225,7 +225,9 @@ class ExtraCoords(ExtraCoordsABC):
         """
         Map of world names to the corresponding `.LookupTableCoord`
         """
-        return {lut[1].wcs.world_axis_names: lut for lut in self._lookup_tables}
+        # The world axis names of the gWCS are those of its output frame, so
+        # get them from the frame to avoid building the models and WCS.
+        return {lut[1].frame.axes_names: lut for lut in self._lookup_tables}
 
     def keys(self):
         # docstring in ABC
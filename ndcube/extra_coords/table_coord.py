@@ -1,11 +1,10 @@
 import abc
 import copy
 from numbers import Integral
+from functools import lru_cache
 from collections import defaultdict
 
 import astropy.units as u
-import gwcs
-import gwcs.coordinate_frames as cf
 import numpy as np
 from astropy.coordinates import SkyCoord
 from astropy.modeling import models
@@ -101,6 +100,9 @@ def _generate_generic_frame(naxes, unit, names=None, physical_types=None):
     """
     Generate a simple frame, where all axes have the same type and unit.
     """
+    # gWCS is slow to import, so it is only imported when a frame or WCS is built.
+    import gwcs.coordinate_frames as cf
+
     axes_order = tuple(range(naxes))
 
     name = None
@@ -109,10 +111,10 @@ def _generate_generic_frame(naxes, unit, names=None, physical_types=None):
     if isinstance(unit, (u.Unit, u.IrreducibleUnit, u.CompositeUnit)):
         unit = tuple([unit] * naxes)
 
-    if all([u.m.is_equivalent(un) for un in unit]):
+    if all(u.m.is_equivalent(un) for un in unit):
         axes_type = "SPATIAL"
 
-    if all([u.pix.is_equivalent(un) for un in unit]):
+    if all(u.pix.is_equivalent(un) for un in unit):
         name = "PixelFrame"
         axes_type = "PIXEL"
 
@@ -122,6 +124,17 @@ def _generate_generic_frame(naxes, unit, names=None, physical_types=None):
                               axes_names=names, name=name, axis_physical_types=physical_types)
 
 
+@lru_cache(maxsize=None)
+def _tabular_model_class(ndim):
+    """
+    Return the Tabular model class for the given number of dimensions.
+
+    `~astropy.modeling.models.tabular_model` creates a new class on every
+    call, so the classes are cached here and shared between lookup tables.
+    """
+    return tabular_model(ndim, name=f"Tabular{ndim}D")
+
+
 def _generate_tabular(lookup_table, interpolation='linear', points_unit=u.pix, **kwargs):
     """
     Generate a Tabular model class and instance.
@@ -130,7 +143,7 @@ def _generate_tabular(lookup_table, interpolation='linear', points_unit=u.pix, *
         raise TypeError("lookup_table must be a Quantity.")  # pragma: no cover
 
     ndim = lookup_table.ndim
-    TabularND = tabular_model(ndim, name=f"Tabular{ndim}D")
+    TabularND = _tabular_model_class(ndim)
 
     # The integer location is at the centre of the pixel.
     points = [(np.arange(size) - 0) * points_unit for size in lookup_table.shape]
@@ -260,6 +273,8 @@ class BaseTableCoordinate(abc.ABC):
         """
         A gWCS object representing all the coordinates.
         """
+        import gwcs
+
         model = self.model
         return gwcs.WCS(forward_transform=model,
                         input_frame=_generate_generic_frame(model.n_inputs, u.pix),
@@ -285,9 +300,10 @@ class QuantityTableCoordinate(BaseTableCoordinate):
     """
 
     def __init__(self, *tables, mesh=False, names=None, physical_types=None):
-        if not all([isinstance(t, u.Quantity) for t in tables]):
+        if not all(isinstance(t, u.Quantity) for t in tables):
             raise TypeError("All tables must be astropy Quantity objects")
-        if not all([t.unit.is_equivalent(tables[0].unit) for t in tables]):
+        # A single table trivially has consistent units.
+        if len(tables) > 1 and not all(t.unit.is_equivalent(tables[0].unit) for t in tables[1:]):
             raise u.UnitsError("All tables must have equivalent units.")
 
         if isinstance(names, str):
@@ -302,8 +318,7 @@ class QuantityTableCoordinate(BaseTableCoordinate):
 
         self.unit = tables[0].unit
 
-        dims = np.array([t.ndim for t in tables])
-        if not mesh and any(dims > 1):
+        if not mesh and any(t.ndim > 1 for t in tables):
             raise NotImplementedError("Support for lookup tables with more than one dimension is not yet implemented")
 
         super().__init__(*tables, mesh=mesh, names=names, physical_types=physical_types)
@@ -440,21 +455,29 @@ class SkyCoordTableCoordinate(BaseTableCoordinate):
                               names=self.names,
                               physical_types=self.physical_types)
         else:
-            self._slice = [self.combine_slices(a, b) for a, b in zip(sane_item, self._slice)]
-            if all([isinstance(s, Integral) for s in self._slice]):
+            # Return a new table coordinate with the combined slice so this one is unchanged.
+            new_table = type(self)(self.table,
+                                   mesh=self.mesh,
+                                   names=self.names,
+                                   physical_types=self.physical_types)
+            new_table._slice = [self.combine_slices(a, b) for a, b in zip(sane_item, self._slice)]
+            if all(isinstance(s, Integral) for s in new_table._slice):
                 # Here we rebuild the SkyCoord with the slice applied to the individual components.
-                new_sc = SkyCoord(self.table.realize_frame(type(self.table.data)(*self._sliced_components)))
+                new_sc = SkyCoord(self.table.realize_frame(
+                    type(self.table.data)(*new_table._sliced_components)))
                 return type(self)(new_sc,
                                   mesh=False,
                                   names=self.names,
                                   physical_types=self.physical_types)
-            return self
+            return new_table
 
     @property
     def frame(self):
         """
         Generate the Frame for this LookupTable.
         """
+        import gwcs.coordinate_frames as cf
+
         sc = self.table
         components = tuple(getattr(sc.data, comp) for comp in sc.data.components)
         ref_frame = sc.frame.replicate_without_data()
@@ -524,6 +547,8 @@ class TimeTableCoordinate(BaseTableCoordinate):
         """
         Generate the Frame for this LookupTable.
         """
+        import gwcs.coordinate_frames as cf
+
         return cf.TemporalFrame(self.reference_time,
                                 unit=u.s,
                                 axes_names=self.names,
@@ -567,6 +592,8 @@ class MultipleTableCoordinate(BaseTableCoordinate):
                             "and not instances of MultipleTableCoordinate.")
         self._table_coords = list(table_coordinates)
         self._dropped_coords = list()
+        # The tables can not be changed after construction, so only count their inputs once.
+        self._n_inputs = sum(t.n_inputs for t in self._table_coords)
 
     def __str__(self):
         classname = self.__class__.__name__
@@ -610,7 +637,11 @@ class MultipleTableCoordinate(BaseTableCoordinate):
         for table in self._table_coords:
             tslice = item[i:i+table.n_inputs]
             i += table.n_inputs
-            new_table = table[tslice]
+            # Slicing with only slice(None) does not change the table, so reuse it.
+            if all(isinstance(s, slice) and s == slice(None) for s in tslice):
+                new_table = table
+            else:
+                new_table = table[tslice]
             if new_table.is_scalar():
                 dropped_tables.append(new_table)
             else:
@@ -622,7 +653,7 @@ class MultipleTableCoordinate(BaseTableCoordinate):
 
     @property
     def n_inputs(self):
-        return sum(t.n_inputs for t in self._table_coords)
+        return self._n_inputs
 
     def is_scalar(self):
         return False
@@ -645,6 +676,8 @@ class MultipleTableCoordinate(BaseTableCoordinate):
         if len(self._table_coords) == 1:
             return self._table_coords[0].frame
         else:
+            import gwcs.coordinate_frames as cf
+
             frames = [t.frame for t in self._table_coords]
 
             # We now have to set the axes_order of all the frames so that we
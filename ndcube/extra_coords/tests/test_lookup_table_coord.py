@@ -416,6 +416,11 @@ def test_2d_skycoord_mesh_slice(lut_2d_skycoord_mesh):
     assert sub_ltc.wcs.world_to_pixel(4*u.deg, 5*u.deg) == [0.0, 0.0]
     assert sub_ltc[1:, 1:].wcs.world_to_pixel(5*u.deg, 6*u.deg) == [0.0, 0.0]
 
+    # Slicing should not modify the original table coordinate.
+    assert sub_ltc.mesh
+    assert sub_ltc._slice == [slice(4, 10, None), slice(5, 10, None)]
+    assert lut_2d_skycoord_mesh._slice == [slice(None)] * 2
+
 
 @pytest.mark.xfail(reason=">1D Tables not supported")
 def test_2d_skycoord_no_mesh_slice(lut_2d_skycoord_no_mesh):
@@ -437,6 +442,15 @@ def test_join_slice(lut_1d_time, lut_1d_wave):
     assert u.allclose(sub_ltc._table_coords[1].table[0], lut_1d_wave.table[0][2:8])
 
 
+def test_join_slice_unsliced_table_reused(lut_1d_time, lut_1d_wave):
+    ltc = lut_1d_time & lut_1d_wave
+
+    sub_ltc = ltc[2:8, :]
+    assert len(sub_ltc._table_coords) == 2
+    assert (sub_ltc._table_coords[0].table == lut_1d_time.table[2:8]).all()
+    assert sub_ltc._table_coords[1] is lut_1d_wave
+
+
 def test_slicing_errors(lut_1d_time, lut_1d_wave, lut_1d_distance, lut_2d_skycoord_mesh):
     with pytest.raises(ValueError) as ei:
         lut_1d_time[1, 2]
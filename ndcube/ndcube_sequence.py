@@ -1,4 +1,3 @@
-import copy
 import numbers
 import textwrap
 
@@ -42,6 +41,38 @@ class NDCubeSequenceBase:
         else:
             self._common_axis = common_axis
 
+    @property
+    def data(self):
+        """
+        The list of cubes in the sequence.
+        """
+        return self._data
+
+    @data.setter
+    def data(self, data_list):
+        self._data = data_list
+        self._cumul_cube_lengths_cache = None
+
+    def _get_cumul_cube_lengths_and_starts(self):
+        """
+        The cumulative lengths of the cubes along the common axis and the
+        cube-like index at which each cube starts.
+
+        The result is cached and recomputed only if the cubes or the common axis change.
+        """
+        # The cache holds references to the cubes it was computed from, so they
+        # can be compared by identity to catch cubes replaced in the data list.
+        cache = self._cumul_cube_lengths_cache
+        if (cache is None or cache[0] != self._common_axis or len(cache[1]) != len(self._data)
+                or not all(cached is cube for cached, cube in zip(cache[1], self._data))):
+            common_axis = self._common_axis
+            common_axis_lengths = np.fromiter((cube.data.shape[common_axis] for cube in self._data),
+                                              dtype=np.intp, count=len(self._data))
+            self._cumul_cube_lengths_cache = (
+                self._common_axis, tuple(self._data),
+                utils.sequence._cumul_lengths_and_starts(common_axis_lengths))
+        return self._cumul_cube_lengths_cache[2]
+
     @property
     def dimensions(self):
         """
@@ -102,25 +133,21 @@ class NDCubeSequenceBase:
     def __getitem__(self, item):
         if isinstance(item, numbers.Integral):
             return self.data[item]
-        # Create an empty sequence in which to place the sliced cubes.
-        result = type(self)([], meta=self.meta, common_axis=self._common_axis)
         if isinstance(item, slice):
-            result.data = self.data[item]
-        else:
-            if isinstance(item[0], numbers.Integral):
-                result = self.data[item[0]][item[1:]]
+            return self._new_instance(self.data[item], meta=self.meta,
+                                      common_axis=self._common_axis)
+        if isinstance(item[0], numbers.Integral):
+            return self.data[item[0]][item[1:]]
+        data = [cube[item[1:]] for cube in self.data[item[0]]]
+        # Determine common axis after slicing.
+        common_axis = self._common_axis
+        if common_axis is not None:
+            drop_cube_axes = [isinstance(i, numbers.Integral) for i in item[1:]]
+            if len(drop_cube_axes) > common_axis and drop_cube_axes[common_axis] is True:
+                common_axis = None
             else:
-                result.data = [cube[item[1:]] for cube in self.data[item[0]]]
-            # Determine common axis after slicing.
-            if self._common_axis is not None:
-                drop_cube_axes = [isinstance(i, numbers.Integral) for i in item[1:]]
-                if (len(drop_cube_axes) > self._common_axis
-                        and drop_cube_axes[self._common_axis] is True):
-                    result._common_axis = None
-                else:
-                    result._common_axis = \
-                        self._common_axis - sum(drop_cube_axes[:self._common_axis])
-        return result
+                common_axis -= sum(drop_cube_axes[:common_axis])
+        return self._new_instance(data, meta=self.meta, common_axis=common_axis)
 
     @property
     def index_as_cube(self):
@@ -468,8 +495,7 @@ class _IndexAsCubeSlicer:
 
     def __getitem__(self, item):
         common_axis = self.seq._common_axis
-        common_axis_lengths = [int(cube.dimensions[common_axis].value) for cube in self.seq.data]
-        n_cube_dims = len(self.seq.cube_like_dimensions)
+        n_cube_dims = self.seq.data[0].data.ndim
         n_uncommon_cube_dims = n_cube_dims - 1
         # If item is iint or slice, turn into a tuple, filling in items
         # for unincluded axes with slice(None). This ensures it is
@@ -485,11 +511,22 @@ class _IndexAsCubeSlicer:
             return self.seq[tuple([slice(None)] + item)]
         if isinstance(item[common_axis], numbers.Integral):
             # If common_axis item is an int or return an NDCube with dimensionality of N-1
-            sequence_index, common_axis_index = \
-                utils.sequence.cube_like_index_to_sequence_and_common_axis_indices(
-                    item[common_axis], common_axis, common_axis_lengths)
+            # Negative indices count back from the end of the cube-like common axis,
+            # consistent with negative slice bounds.
+            if len(self.seq.data) == 1:
+                # With only one cube, the cube-like index is the index into that cube.
+                sequence_index = 0
+                common_axis_index = utils.sequence._sanitize_cube_like_index(
+                    item[common_axis], self.seq.data[0].data.shape[common_axis])
+            else:
+                cumul_cube_lengths, cube_starts = self.seq._get_cumul_cube_lengths_and_starts()
+                cube_like_index = utils.sequence._sanitize_cube_like_index(
+                    item[common_axis], int(cumul_cube_lengths[-1]))
+                sequence_index, common_axis_index = \
+                    utils.sequence._cube_like_index_to_sequence_and_common_axis_indices(
+                        cube_like_index, cumul_cube_lengths, cube_starts)
             # Insert index for common axis in item for slicing the NDCube.
-            cube_item = copy.deepcopy(item)
+            cube_item = list(item)
             cube_item[common_axis] = common_axis_index
             return self.seq.data[sequence_index][tuple(cube_item)]
         else:
@@ -504,13 +541,21 @@ class _IndexAsCubeSlicer:
             # is returned, not an NDCubeSequence.
             # common_axis of returned sequence must be altered if axes in front of it
             # are sliced away.
-            sequence_items = utils.sequence.cube_like_tuple_item_to_sequence_items(
-                item, common_axis, common_axis_lengths, n_cube_dims)
+            if len(self.seq.data) == 1:
+                # The common axis slice is normalised as for multiple cubes
+                # before the item is applied to the cube.
+                cube_item = list(item)
+                cube_item[common_axis] = utils.sequence._sanitize_common_axis_slice(
+                    item[common_axis], self.seq.data[0].data.shape[common_axis])
+                sequence_items = [utils.sequence.SequenceItem(0, tuple(cube_item))]
+            else:
+                cumul_cube_lengths, cube_starts = self.seq._get_cumul_cube_lengths_and_starts()
+                sequence_items = utils.sequence._cube_like_tuple_item_to_sequence_items(
+                    item, common_axis, cumul_cube_lengths, cube_starts)
             # Work out new common axis value if axes in front of it are sliced away.
             new_common_axis = common_axis - sum([isinstance(i, numbers.Integral)
                                                  for i in item[:common_axis]])
-            # Copy sequence and alter the data and common axis.
-            result = type(self.seq)([], meta=self.seq.meta, common_axis=new_common_axis)
-            result.data = [self.seq.data[sequence_item.sequence_index][sequence_item.cube_item]
-                           for sequence_item in sequence_items]
-            return result
+            # Create the new sequence directly from the sliced cubes.
+            data = [self.seq.data[sequence_item.sequence_index][sequence_item.cube_item]
+                    for sequence_item in sequence_items]
+            return self.seq._new_instance(data, meta=self.seq.meta, common_axis=new_common_axis)
@@ -98,11 +98,11 @@ def assert_metas_equal(test_input, expected_output):
 def assert_cubes_equal(test_input, expected_cube):
     unittest.TestCase()
     assert isinstance(test_input, type(expected_cube))
-    assert np.all(test_input.mask == expected_cube.mask)
+    assert np.array_equal(test_input.mask, expected_cube.mask)
     assert_wcs_are_equal(test_input.wcs, expected_cube.wcs)
-    if test_input.uncertainty:
+    if test_input.uncertainty and test_input.uncertainty is not expected_cube.uncertainty:
         assert test_input.uncertainty.array.shape == expected_cube.uncertainty.array.shape
-    assert all(test_input.dimensions.value == expected_cube.dimensions.value)
+    assert np.array_equal(test_input.dimensions.value, expected_cube.dimensions.value)
     assert test_input.dimensions.unit == expected_cube.dimensions.unit
     if type(test_input.extra_coords) is not type(expected_cube.extra_coords):
         raise AssertionError("NDCube extra_coords not of same type: {0} != {1}".format(
@@ -102,6 +102,71 @@ def test_index_as_cube(ndc, item, expected_dimensions):
         (dim == expected_dim).all()
 
 
+@pytest.mark.parametrize("ndc", (("ndcubesequence_4c_ln_lt_l_cax1",)), indirect=("ndc",))
+def test_index_as_cube_negative_start(ndc):
+    sliced_sequence = ndc.index_as_cube[:, -4:]
+    assert len(sliced_sequence) == 2
+    assert sliced_sequence.data[0].data.shape == (2, 1, 4)
+    assert sliced_sequence.data[1].data.shape == (2, 3, 4)
+
+
+@pytest.mark.parametrize("ndc", (("ndcubesequence_4c_ln_lt_l_cax1",)), indirect=("ndc",))
+def test_index_as_cube_negative_int(ndc):
+    wcs = ndc.data[0].wcs
+    shape = ndc.data[0].data.shape
+    seq = NDCubeSequence([NDCube(np.zeros(shape), wcs=wcs), NDCube(np.ones(shape), wcs=wcs)],
+                         common_axis=1)
+    # Negative ints count back from the end of the cube-like common axis, like slices.
+    assert (seq.index_as_cube[:, -1].data == 1).all()
+    assert (seq.index_as_cube[:, -1:].data[0].data == 1).all()
+    assert (seq.index_as_cube[:, -6].data == 0).all()
+    with pytest.raises(IndexError):
+        seq.index_as_cube[:, -7]
+    with pytest.raises(IndexError):
+        seq.index_as_cube[:, 6]
+
+
+@pytest.mark.parametrize("ndc", (("ndcubesequence_4c_ln_lt_l_cax1",)), indirect=("ndc",))
+@pytest.mark.parametrize("item", ((slice(None), slice(3, 3)),
+                                  (slice(None), slice(5, 2)),
+                                  (slice(None), slice(12, None)),
+                                  (slice(None), slice(100, None))))
+def test_index_as_cube_empty_slice(ndc, item):
+    with pytest.raises(IndexError, match="common axis with size 12"):
+        ndc.index_as_cube[item]
+
+
+@pytest.mark.parametrize("ndc", (("ndcubesequence_4c_ln_lt_l_cax1",)), indirect=("ndc",))
+def test_index_as_cube_single_cube(ndc):
+    seq = ndc[0:1]
+    sliced_sequence = seq.index_as_cube[:, 1:3]
+    assert isinstance(sliced_sequence, NDCubeSequence)
+    assert sliced_sequence._common_axis == 1
+    assert len(sliced_sequence) == 1
+    assert sliced_sequence.data[0].data.shape == (2, 2, 4)
+    # The step is ignored, as for sequences of multiple cubes.
+    sliced_sequence = seq.index_as_cube[:, 1::2]
+    assert sliced_sequence.data[0].data.shape == (2, 2, 4)
+    assert ndc.index_as_cube[:, 1:3:2].data[0].data.shape == (2, 2, 4)
+    cube = seq.index_as_cube[0, 1]
+    assert isinstance(cube, NDCube)
+    np.testing.assert_array_equal(cube.data, seq.data[0].data[0, 1])
+
+
+@pytest.mark.parametrize("ndc", (("ndcubesequence_4c_ln_lt_l_cax1",)), indirect=("ndc",))
+@pytest.mark.parametrize("item", ((slice(None), slice(3, 3)),
+                                  (slice(None), slice(2, 1)),
+                                  (slice(None), slice(3, None)),
+                                  (slice(None), slice(100, None)),
+                                  (slice(None), 3),
+                                  (slice(None), -4)))
+def test_index_as_cube_single_cube_errors(ndc, item):
+    # A sequence of one cube raises the same errors as a sequence of many.
+    seq = ndc[0:1]
+    with pytest.raises(IndexError, match="common axis with size 3"):
+        seq.index_as_cube[item]
+
+
 @pytest.mark.parametrize("ndc, axis, expected_dimensions",
                          (
                              ("ndcubesequence_4c_ln_lt_l", 0, (8 * u.pix,
@@ -160,6 +225,29 @@ def test_cube_like_dimensions_error(ndc):
         ndc.cube_like_dimensions
 
 
+@pytest.mark.parametrize("ndc", (("ndcubesequence_4c_ln_lt_l_cax1",)), indirect=("ndc",))
+def test_cumul_cube_lengths_and_starts(ndc):
+    cumul_lengths, cube_starts = ndc._get_cumul_cube_lengths_and_starts()
+    np.testing.assert_array_equal(cumul_lengths, [3, 6, 9, 12])
+    np.testing.assert_array_equal(cube_starts, [0, 3, 6, 9])
+    # Check the cached lengths are updated when the cubes change.
+    ndc.data = ndc.data[:2]
+    cumul_lengths, cube_starts = ndc._get_cumul_cube_lengths_and_starts()
+    np.testing.assert_array_equal(cumul_lengths, [3, 6])
+    np.testing.assert_array_equal(cube_starts, [0, 3])
+    ndc.data.append(ndc.data[0][:, 1:])
+    cumul_lengths, cube_starts = ndc._get_cumul_cube_lengths_and_starts()
+    np.testing.assert_array_equal(cumul_lengths, [3, 6, 8])
+    np.testing.assert_array_equal(cube_starts, [0, 3, 6])
+    # Replacing a cube without changing the number of cubes.
+    ndc.data[0] = ndc.data[0][:, :1]
+    cumul_lengths, cube_starts = ndc._get_cumul_cube_lengths_and_starts()
+    np.testing.assert_array_equal(cumul_lengths, [1, 4, 6])
+    np.testing.assert_array_equal(cube_starts, [0, 1, 4])
+    sliced_sequence = ndc.index_as_cube[:, 0:2]
+    assert [cube.data.shape for cube in sliced_sequence.data] == [(2, 1, 4), (2, 1, 4)]
+
+
 @pytest.mark.parametrize("ndc", (("ndcubesequence_3c_l_ln_lt_cax1",)), indirect=("ndc",))
 def test_common_axis_coords(ndc):
     # Construct expected skycoord
@@ -3,7 +3,6 @@
 Utilities for ndcube sequence.
 """
 
-from copy import deepcopy
 from collections import namedtuple
 
 import numpy as np
@@ -46,15 +45,64 @@ def cube_like_index_to_sequence_and_common_axis_indices(cube_like_index, common_
     common_axis_index: `int`
         The index along the cube's common axis to which the input cube-like index corresponds.
     """
+    return _cube_like_index_to_sequence_and_common_axis_indices(
+        cube_like_index, *_cumul_lengths_and_starts(common_axis_lengths))
+
+
+def _cumul_lengths_and_starts(common_axis_lengths):
+    """
+    Return the cumulative lengths of the cubes along the common axis and the
+    cube-like index at which each cube starts.
+    """
     cumul_lengths = np.cumsum(common_axis_lengths)
-    sequence_index = np.arange(len(cumul_lengths))[cumul_lengths > cube_like_index][0]
-    if sequence_index == 0:
-        common_axis_index = cube_like_index
-    else:
-        common_axis_index = cube_like_index - cumul_lengths[sequence_index - 1]
+    return cumul_lengths, cumul_lengths - common_axis_lengths
+
+
+def _cube_like_index_to_sequence_and_common_axis_indices(cube_like_index, cumul_lengths,
+                                                         cube_starts):
+    """
+    As `cube_like_index_to_sequence_and_common_axis_indices` but taking the
+    cumulative lengths of the cubes along the common axis and the cube-like
+    index at which each cube starts.
+
+    cube_like_index may also be an array of indices, in which case arrays of
+    sequence and common axis indices are returned.
+    """
+    sequence_index = np.searchsorted(cumul_lengths, cube_like_index, side="right")
+    common_axis_index = cube_like_index - cube_starts[sequence_index]
     return sequence_index, common_axis_index
 
 
+def _sanitize_cube_like_index(cube_like_index, common_axis_length):
+    """
+    Convert a cube-like int index to a non-negative index along the common axis.
+
+    Negative indices count back from the end of the common axis.
+    An `IndexError` is raised if the index is outside the common axis.
+    """
+    index = cube_like_index + common_axis_length if cube_like_index < 0 else cube_like_index
+    if not 0 <= index < common_axis_length:
+        raise IndexError(f"index {cube_like_index} is out of bounds for common axis "
+                         f"with size {common_axis_length}")
+    return index
+
+
+def _sanitize_common_axis_slice(common_axis_slice, common_axis_length):
+    """
+    Convert a cube-like slice to a slice with non-negative start and stop along the common axis.
+
+    The step is not supported so is dropped. Negative bounds count back
+    from the end of the common axis and stops beyond its end are clipped.
+    An `IndexError` is raised if the slice selects no elements.
+    """
+    start, stop, _ = slice(common_axis_slice.start,
+                           common_axis_slice.stop).indices(common_axis_length)
+    if start >= stop:
+        raise IndexError(f"slice {common_axis_slice.start}:{common_axis_slice.stop} selects no "
+                         f"elements of common axis with size {common_axis_length}")
+    return slice(start, stop)
+
+
 def cube_like_tuple_item_to_sequence_items(item, common_axis, common_axis_lengths, n_cube_dims):
     """
     Convert a tuple for slicing an NDCubeSequence in the cube-like API to a list of SequenceItems.
@@ -83,6 +131,16 @@ def cube_like_tuple_item_to_sequence_items(item, common_axis, common_axis_length
         in the NDCubeSequence that would result by applying the input slicing item
         via the cube-like API.
     """
+    return _cube_like_tuple_item_to_sequence_items(
+        item, common_axis, *_cumul_lengths_and_starts(common_axis_lengths))
+
+
+def _cube_like_tuple_item_to_sequence_items(item, common_axis, cumul_lengths, cube_starts):
+    """
+    As `cube_like_tuple_item_to_sequence_items` but taking the cumulative
+    lengths of the cubes along the common axis and the cube-like index at
+    which each cube starts.
+    """
     if not hasattr(item, "__len__"):
         raise TypeError("item must be an iterable of slices and/or ints.")
     if len(item) <= common_axis:
@@ -96,23 +154,16 @@ def cube_like_tuple_item_to_sequence_items(item, common_axis, common_axis_length
     default_cube_item[common_axis] = slice(None)
 
     # Convert start and stop cube-like indices to sequence and cube indices.
-    if item[common_axis].start is None:
-        common_axis_start = 0
-    else:
-        common_axis_start = item[common_axis].start
-    if item[common_axis].stop is None:
-        common_axis_stop = sum(common_axis_lengths)
-    else:
-        common_axis_stop = item[common_axis].stop
-    item[common_axis] = slice(common_axis_start, common_axis_stop)
-    start_sequence_index, start_common_axis_index = \
-        cube_like_index_to_sequence_and_common_axis_indices(
-            item[common_axis].start, common_axis, common_axis_lengths)
-    stop_sequence_index, stop_common_axis_index = \
-        cube_like_index_to_sequence_and_common_axis_indices(
-            item[common_axis].stop - 1, common_axis, common_axis_lengths)
+    item[common_axis] = _sanitize_common_axis_slice(item[common_axis], int(cumul_lengths[-1]))
+    common_axis_start, common_axis_stop = item[common_axis].start, item[common_axis].stop
+    sequence_indices, common_axis_indices = \
+        _cube_like_index_to_sequence_and_common_axis_indices(
+            np.array([common_axis_start, common_axis_stop - 1]), cumul_lengths, cube_starts)
+    # Ensure indices are ints, not np.int64.
+    start_sequence_index, stop_sequence_index = sequence_indices.tolist()
+    start_common_axis_index, stop_common_axis_index = common_axis_indices.tolist()
     stop_common_axis_index += 1
-    # In the two lines above, the stop index was decremented by one in the
+    # Above, the stop index was decremented by one in the
     # calculation of the stop sequence axis to avoid ticking over to new NDCube if not needed.
     # Once the correct sequence index was found,
     # 1 was added back onto the corresponding common axis index.
@@ -121,7 +172,7 @@ def cube_like_tuple_item_to_sequence_items(item, common_axis, common_axis_length
     n_cubes_after_first = stop_sequence_index - start_sequence_index
     # If only one cube included in slicing item, return iterable of single SequenceItem
     if n_cubes_after_first == 0:
-        cube_item = deepcopy(default_cube_item)
+        cube_item = list(default_cube_item)
         cube_item[common_axis] = slice(start_common_axis_index, stop_common_axis_index)
         sequence_items = [SequenceItem(start_sequence_index, tuple(cube_item))]
     else:
@@ -132,11 +183,11 @@ def cube_like_tuple_item_to_sequence_items(item, common_axis, common_axis_length
             sequence_items = []
         # Insert final cube if there is one after the first.
         if n_cubes_after_first > 0:
-            final_cube_item = deepcopy(default_cube_item)
+            final_cube_item = list(default_cube_item)
             final_cube_item[common_axis] = slice(0, stop_common_axis_index)
             sequence_items.append(SequenceItem(stop_sequence_index, final_cube_item))
         # Finally, add Sequence index for first cube.
-        first_cube_item = deepcopy(default_cube_item)
+        first_cube_item = list(default_cube_item)
         first_cube_item[common_axis] = slice(start_common_axis_index, None)
         sequence_items.insert(0, SequenceItem(start_sequence_index, first_cube_item))
     return sequence_items
@@ -1,4 +1,5 @@
 
+import numpy as np
 import pytest
 
 from ndcube import utils
@@ -27,6 +28,14 @@ def test_cube_like_index_to_sequence_and_common_axis_indices(
     assert common_axis_index == expected_common_idx
 
 
+def test_cube_like_index_to_sequence_and_common_axis_indices_array():
+    sequence_index, common_axis_index = \
+        utils.sequence._cube_like_index_to_sequence_and_common_axis_indices(
+            np.array([0, 2, 3, 5]), np.array([3, 4, 6]), np.array([0, 3, 4]))
+    np.testing.assert_array_equal(sequence_index, [0, 0, 1, 2])
+    np.testing.assert_array_equal(common_axis_index, [0, 2, 0, 1])
+
+
 @pytest.mark.parametrize(
     "item, common_axis, common_axis_lengths, n_cube_dims, expected_sequence_items", [
         ((slice(None), slice(4, 6)), 1, [3, 3], 4,
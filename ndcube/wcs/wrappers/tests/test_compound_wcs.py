@@ -10,6 +10,7 @@ from astropy.wcs.wcsapi import HighLevelWCSWrapper
 from numpy.testing import assert_allclose, assert_equal
 
 from ndcube.wcs.wrappers import CompoundLowLevelWCS
+from ndcube.wcs.wrappers.compound_wcs import Mapping
 
 
 @pytest.fixture
@@ -173,3 +174,11 @@ def test_shared_pixel_axis_compound_3d(spectral_cube_3d_fitswcs, time_1d_fitswcs
 
     with pytest.raises(ValueError):
         wcs.world_to_pixel_values((14, -10, -2.6e+10, -7.0))
+
+
+def test_mapping_inverse():
+    assert Mapping((0, 1, 2, 1)).inverse.mapping == (0, 1, 2)
+    assert Mapping((2, 0, 1, 0)).inverse.mapping == (1, 2, 0)
+
+    with pytest.raises(ValueError):
+        Mapping((0, 2)).inverse